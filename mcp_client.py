@@ -1,36 +1,152 @@
 import asyncio
+import functools
+import sys
+from collections import OrderedDict
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 import os
 import json
-from groq import Groq
+import re
+from typing import Awaitable, Optional
+from groq import AsyncGroq
 from dotenv import load_dotenv
 
 load_dotenv()
 
-async def generate_response(query: str, available_tools: list) -> dict:
-    """Use Groq to identify which tool to use and with what parameters."""
-    client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+# Tool selection is a small structured-output task, so a fast model suffices
+GROQ_MODEL = os.getenv("GROQ_MODEL", "llama-3.1-8b-instant")
+DECISION_CACHE_SIZE = 256
+_decision_cache: OrderedDict = OrderedDict()
+
+# Canonical queries are routed without the LLM. A route is only taken when the whole
+# query matches it and it mentions exactly as many tickers as the tool needs; anything
+# else (extra tickers, comparisons phrased as price questions, ...) goes to Groq.
+# Keywords are case-insensitive, but tickers must be written in upper case so ordinary
+# words are never taken as symbols.
+_SYMBOL = r"\$?([A-Z]{1,5}(?:[.-][A-Z])?)(?![\w&/])"
+_TICKER_TOKEN = re.compile(r"(?<![\w$&./-])\$?[A-Z]{1,5}(?:[.-][A-Z])?(?![\w&/])")
+_LEAD = (r"(?i:(?:please\s+)?(?:(?:what(?:'s|s|\s+is|\s+are)|get|show(?:\s+me)?|give\s+me"
+         r"|tell\s+me|check|look\s*up)\s+)?(?:(?:the|a)\s+)?(?:(?:current|latest|live)\s+)?)")
+_TAIL = r"(?i:\s+(?:stock|shares))?(?i:\s+(?:today|now|right\s+now))?\s*[?.!]?"
+
+def _route(pattern: str, tool_name: str, *params: str) -> tuple:
+    return re.compile(pattern), tool_name, params
+
+FAST_PATH_ROUTES = [
+    _route(r"(?i:(?:please\s+)?compare\s+(?:the\s+)?(?:(?:stock\s+)?prices?\s+of\s+)?)" + _SYMBOL
+           + r"(?i:\s+(?:and|vs\.?|versus|with|to)\s+)" + _SYMBOL + _TAIL,
+           "compare_stocks", "symbol1", "symbol2"),
+    _route(_LEAD + _SYMBOL + r"(?i:\s+(?:vs\.?|versus)\s+)" + _SYMBOL + _TAIL,
+           "compare_stocks", "symbol1", "symbol2"),
+    _route(_LEAD + r"(?i:(?:fundamentals|metrics|financials|p/e(?:\s+ratio)?)\s+(?:of|for)\s+)"
+           + _SYMBOL + _TAIL,
+           "get_stock_fundamentals", "symbol"),
+    _route(_LEAD + _SYMBOL + r"(?i:\s+(?:fundamentals|metrics|financials|p/e(?:\s+ratio)?))" + _TAIL,
+           "get_stock_fundamentals", "symbol"),
+    _route(_LEAD + r"(?i:(?:(?:stock|share)\s+)?(?:price|quote)\s+(?:of|for)\s+)" + _SYMBOL + _TAIL,
+           "get_stock_price", "symbol"),
+    _route(_LEAD + _SYMBOL + r"(?i:(?:\s+(?:stock|share))?\s+(?:price|quote))" + _TAIL,
+           "get_stock_price", "symbol"),
+    _route(_LEAD + r"(?i:market\s+(?:summary|overview)|how\s+(?:are|is)\s+the\s+markets?\s+doing)"
+           + _TAIL,
+           "get_market_summary"),
+]
+
+@functools.cache
+def get_client() -> AsyncGroq:
+    """Return the shared async Groq client, created on first use and reused for all queries."""
+    return AsyncGroq(api_key=os.getenv("GROQ_API_KEY"))
+
+def match_fast_path(query: str) -> Optional[dict]:
+    """Return a tool decision for canonical queries like "price of AAPL", or None."""
+    query = query.strip()
+    ticker_count = len(_TICKER_TOKEN.findall(query))
+    for pattern, tool_name, params in FAST_PATH_ROUTES:
+        match = pattern.fullmatch(query)
+        if match and ticker_count == len(params):
+            return {"tool_name": tool_name, "arguments": dict(zip(params, match.groups()))}
+    return None
+
+async def generate_response(query: str, tools_json: str) -> dict:
+    """Use Groq to identify which tool to use and with what parameters.
+
+    Canonical queries are answered by match_fast_path without calling Groq. tools_json is
+    the tool list serialized once per session. Decisions are cached per (query, tools_json),
+    so repeating a query skips the LLM call. The returned decision's "source" says which of
+    these produced it ("fast path", "cache" or "Groq").
+    """
+    decision = match_fast_path(query)
+    if decision is not None:
+        return {**decision, "source": "fast path"}
+    
+    key = (query.strip().lower(), tools_json)
+    if key in _decision_cache:
+        _decision_cache.move_to_end(key)
+        return {**_decision_cache[key], "source": "cache"}
     
     prompt = f"""Given this user query: "{query}"
     
 Available tools:
-{json.dumps(available_tools, indent=2)}
+{tools_json}
 
 Identify which tool to use and what parameters to provide.
 Respond ONLY with JSON in this format:
 {{"tool_name": "tool_name", "arguments": {{"param": "value"}}}}"""
 
-    response = client.chat.completions.create(
-        model="llama-3.3-70b-versatile",
+    response = await get_client().chat.completions.create(
+        model=GROQ_MODEL,
         messages=[{"role": "user", "content": prompt}],
-        temperature=0.1
+        temperature=0.1,
+        response_format={"type": "json_object"}
     )
     
-    return json.loads(response.choices[0].message.content.strip().replace('```json', '').replace('```', ''))
+    decision = json.loads(response.choices[0].message.content)
+    decision["source"] = "Groq"
+    _decision_cache[key] = decision
+    if len(_decision_cache) > DECISION_CACHE_SIZE:
+        _decision_cache.popitem(last=False)
+    return decision
+
+async def execute(session: ClientSession, decision: Awaitable[dict]) -> str:
+    """Await a tool decision, run the chosen MCP tool, and return the printable output."""
+    try:
+        decision = await decision
+        tool_name = decision.get("tool_name")
+        arguments = decision.get("arguments", {})
+        
+        # Execute the tool
+        result = await session.call_tool(tool_name, arguments=arguments)
+        source = decision.get("source", "Groq")
+        return (f"\nRouted to tool ({source}): {tool_name} with args: {arguments}\n"
+                f"\nResult: {result.content[0].text}")
+        
+    except Exception as e:
+        return f"Error: {e}"
+
+async def handle(session: ClientSession, query: str, tools_json: str) -> str:
+    """Route a single query to an MCP tool and run it, returning the printable output."""
+    return await execute(session, generate_response(query, tools_json))
+
+async def run_batch(session: ClientSession, queries: list, tools_json: str) -> None:
+    """Pipeline a batch of queries so LLM routing and tool calls overlap.
+
+    Every route decision starts immediately, and each tool call starts as soon as its own
+    decision resolves rather than after the previous query finishes. Output is printed in
+    input order, each query as soon as it and all earlier ones are done.
+    """
+    decision_tasks = [asyncio.create_task(generate_response(q, tools_json)) for q in queries]
+    tool_tasks = [asyncio.create_task(execute(session, task)) for task in decision_tasks]
+    
+    for query, task in zip(queries, tool_tasks):
+        print(f"\n> {query}")
+        print(await task)
 
 async def main():
-    """Main client that connects to MCP server and uses Gemini for tool selection."""
+    """Main client that connects to MCP server and uses Groq for tool selection.
+
+    Pass a file with one query per line to run the queries as a pipelined batch instead
+    of reading them interactively.
+    """
     server_params = StdioServerParameters(
         command="python",
         args=["mcp_server.py"],
@@ -51,6 +167,17 @@ async def main():
             print("MCP Client connected. Available tools:")
             for tool in available_tools:
                 print(f"  - {tool['name']}: {tool['description']}")
+            
+            # The tool list is fixed for the session, so serialize it for the prompt once
+            tools_json = json.dumps(available_tools, indent=2)
+            
+            if len(sys.argv) > 1:
+                with open(sys.argv[1], encoding="utf-8") as f:
+                    queries = [line.strip() for line in f if line.strip()]
+                
+                await run_batch(session, queries, tools_json)
+                return
+            
             print("\nEnter your query (or 'quit' to exit):")
             
             while True:
@@ -61,20 +188,7 @@ async def main():
                 if not query:
                     continue
                 
-                try:
-                    # Use Gemini to determine tool and arguments
-                    decision = await generate_response(query, available_tools)
-                    tool_name = decision.get("tool_name")
-                    arguments = decision.get("arguments", {})
-                    
-                    print(f"\nGroq chose tool: {tool_name} with args: {arguments}")
-                    
-                    # Execute the tool
-                    result = await session.call_tool(tool_name, arguments=arguments)
-                    print(f"\nResult: {result.content[0].text}")
-                    
-                except Exception as e:
-                    print(f"Error: {e}")
+                print(await handle(session, query, tools_json))
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
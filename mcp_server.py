@@ -11,6 +11,7 @@ Features:
 - Market fundamentals and key metrics
 - Market summary and index tracking
 - Robust error handling and logging
+- Non-blocking tools: network I/O runs in worker threads off the event loop
 - CSV fallback for offline capability
 - Type-safe tool definitions with detailed schemas
 
@@ -22,7 +23,8 @@ Available Tools:
 
 Architecture:
 - Fallback Strategy: Yahoo Finance API → Local CSV file
-- Data Sources: yfinance, pandas
+- Caching: in-memory (per minute) → on-disk JSON (.cache/) → Yahoo Finance
+- Data Sources: yfinance, local CSV (stdlib csv module)
 - Protocol: Model Context Protocol (MCP)
 - Server Framework: FastMCP
 
@@ -34,13 +36,24 @@ Author: AI Assistant
 Version: 1.0.0
 """
 
+import asyncio
+import contextlib
+import csv
+import functools
+import json
 import logging
-from typing import Optional, Dict, Any
+import random
+import re
+import tempfile
+import threading
+import time
+from typing import TYPE_CHECKING, Optional, Dict, Any, Callable, TypeVar
 from mcp.server.fastmcp import FastMCP
-import yfinance as yf
-import pandas as pd
 import os
 
+if TYPE_CHECKING:
+    import yfinance as yf
+
 # ============================================================================
 # Configuration
 # ============================================================================
@@ -58,14 +71,373 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Hard per-request budget for Yahoo Finance calls (seconds)
+YAHOO_TIMEOUT = float(os.getenv("STOCK_YAHOO_TIMEOUT", "5.0"))
+
+# Attempts per Yahoo Finance call on transient errors (rate limits, 5xx);
+# always at least one, so every call is made
+YAHOO_MAX_ATTEMPTS = max(1, int(os.getenv("STOCK_YAHOO_ATTEMPTS", "3")))
+
+# Seconds to wait for Yahoo Finance before answering from the CSV fallback
+YAHOO_HEDGE_TIMEOUT = float(os.getenv("STOCK_HEDGE_TIMEOUT", "2.0"))
+
+# In-memory cache lifetime for Yahoo Finance lookups (seconds)
+CACHE_TTL_SECONDS = int(os.getenv("STOCK_CACHE_TTL", "60"))
+
+# On-disk cache location and per-endpoint lifetimes (seconds)
+CACHE_DIR = os.getenv(
+    "STOCK_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+)
+FILE_CACHE_TTLS = {
+    "price": int(os.getenv("STOCK_PRICE_CACHE_TTL", str(15 * 60))),
+    "quote": int(os.getenv("STOCK_PRICE_CACHE_TTL", str(15 * 60))),
+    "info": int(os.getenv("STOCK_INFO_CACHE_TTL", str(24 * 60 * 60))),
+}
+
 # Initialize MCP server
 mcp = FastMCP("Stock Server")
 
 
+# ============================================================================
+# Caching
+# ============================================================================
+
+def _time_bucket() -> int:
+    """Current cache bucket; lookups keyed on it expire every CACHE_TTL_SECONDS."""
+    return int(time.time() // CACHE_TTL_SECONDS)
+
+
+class FileCache:
+    """
+    Persistent JSON cache for Yahoo Finance responses.
+    
+    Each entry is stored as {directory}/{symbol}_{endpoint}.json with a
+    {"ts": ..., "data": ...} envelope, so cached data survives server
+    restarts. Entries older than the endpoint's TTL are treated as misses.
+    
+    Example:
+        >>> cache = FileCache(".cache", {"info": 86400})
+        >>> cache.set("AAPL", "info", {"longName": "Apple Inc."})
+        >>> cache.get("AAPL", "info")
+        {'longName': 'Apple Inc.'}
+    """
+    
+    def __init__(self, directory: str, ttls: Dict[str, int]):
+        self.directory = directory
+        self.ttls = ttls
+        self.hits = 0
+        self.misses = 0
+    
+    def _path(self, symbol: str, endpoint: str) -> str:
+        safe_symbol = re.sub(r"[^A-Za-z0-9^._-]", "_", symbol.upper())
+        return os.path.join(self.directory, f"{safe_symbol}_{endpoint}.json")
+    
+    def get(self, symbol: str, endpoint: str) -> Optional[Any]:
+        """
+        Return cached data for (symbol, endpoint), or None on miss/expiry.
+        """
+        data = None
+        try:
+            with open(self._path(symbol, endpoint), encoding="utf-8") as f:
+                entry = json.load(f)
+            if time.time() - entry["ts"] < self.ttls.get(endpoint, 0):
+                data = entry["data"]
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable cache entry for {symbol} ({endpoint}): {e}")
+        
+        if data is None:
+            self.misses += 1
+            logger.info(f"Cache miss: {symbol} ({endpoint}) [hits={self.hits}, misses={self.misses}]")
+        else:
+            self.hits += 1
+            logger.info(f"Cache hit: {symbol} ({endpoint}) [hits={self.hits}, misses={self.misses}]")
+        return data
+    
+    def set(self, symbol: str, endpoint: str, data: Any) -> None:
+        """
+        Store data for (symbol, endpoint). Write errors are logged, not raised.
+        """
+        path = self._path(symbol, endpoint)
+        tmp_path = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Unique temp file per writer, so concurrent worker threads never
+            # truncate each other's output before the atomic replace
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.directory, prefix=os.path.basename(path) + ".", suffix=".tmp"
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"ts": time.time(), "data": data}, f, default=str)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry for {symbol} ({endpoint}): {e}")
+            if tmp_path is not None:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_path)
+    
+    def invalidate(self, symbol: str) -> None:
+        """
+        Remove every cached endpoint for a symbol.
+        """
+        for endpoint in self.ttls:
+            try:
+                os.remove(self._path(symbol, endpoint))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Could not remove cache entry for {symbol} ({endpoint}): {e}")
+
+
+file_cache = FileCache(CACHE_DIR, FILE_CACHE_TTLS)
+
+
+@functools.cache
+def _yf():
+    """
+    Import yfinance on first use.
+    
+    yfinance (and pandas underneath it) dominates import time, and MCP
+    clients spawn a fresh server process per session, so the import is
+    deferred until a tool actually needs Yahoo Finance.
+    """
+    import yfinance
+    return yfinance
+
+
+@functools.cache
+def _curl_requests():
+    """Import curl_cffi's requests-compatible API on first use."""
+    from curl_cffi import requests as curl_requests
+    return curl_requests
+
+
+@functools.cache
+def _http_session():
+    """
+    Return the HTTP session shared by every Yahoo Finance call.
+    
+    Reusing one session keeps pooled keep-alive connections instead of
+    paying a fresh TLS handshake per call.
+    """
+    return _curl_requests().Session(impersonate="chrome")
+
+
+T = TypeVar("T")
+
+
+def with_retries(fetch: Callable[[], T], description: str) -> T:
+    """
+    Run a Yahoo Finance call, retrying transient failures with backoff.
+    
+    Rate limits, curl_cffi request errors and JSON decode errors raised by
+    fetch are retried up to YAHOO_MAX_ATTEMPTS times with exponential
+    backoff plus jitter. Timeouts are not retried, since the caller's
+    latency budget is already spent. Only errors that propagate out of
+    fetch can be retried, so wrapped yfinance calls must not swallow them
+    (e.g. history() needs raise_errors=True). Runs in worker threads, so
+    it sleeps with time.sleep.
+    
+    Args:
+        fetch: Zero-argument callable performing the Yahoo Finance call
+        description: What is being fetched, for log messages
+        
+    Returns:
+        Whatever fetch returns
+        
+    Raises:
+        The last exception if every attempt fails, or any non-transient error
+    """
+    transient_errors = (
+        _curl_requests().exceptions.RequestException,
+        _yf().exceptions.YFRateLimitError,
+        json.JSONDecodeError,
+    )
+    
+    for attempt in range(YAHOO_MAX_ATTEMPTS):
+        try:
+            return fetch()
+        except transient_errors as e:
+            is_last = attempt == YAHOO_MAX_ATTEMPTS - 1
+            if is_last or isinstance(e, _curl_requests().exceptions.Timeout):
+                raise
+            delay = 0.1 * 2 ** attempt + random.random() * 0.05
+            logger.warning(f"Transient Yahoo Finance error for {description} "
+                           f"({type(e).__name__}), retrying in {delay:.2f}s")
+            time.sleep(delay)
+
+
+_TICKER_CACHE: Dict[str, "yf.Ticker"] = {}
+_ticker_cache_bucket: Optional[int] = None
+
+
+def yf_ticker(symbol: str) -> "yf.Ticker":
+    """
+    Return a memoized yfinance Ticker for the given symbol.
+    
+    Ticker objects hold their own lazily-populated state, so reusing them
+    across tool calls avoids rebuilding that state on every invocation.
+    Since a Ticker never refreshes its own info, the cache is dropped
+    whenever the time bucket rolls over.
+    
+    Args:
+        symbol: Stock ticker symbol (already normalized to upper case)
+        
+    Returns:
+        Shared yf.Ticker instance for the symbol
+    """
+    global _ticker_cache_bucket
+    
+    bucket = _time_bucket()
+    if bucket != _ticker_cache_bucket:
+        _TICKER_CACHE.clear()
+        _ticker_cache_bucket = bucket
+    
+    ticker = _TICKER_CACHE.get(symbol)
+    if ticker is None:
+        ticker = _TICKER_CACHE[symbol] = _yf().Ticker(symbol, session=_http_session())
+    return ticker
+
+
+def _ticker_call(symbol: str, fetch: Callable[["yf.Ticker"], T]) -> T:
+    """
+    Run fetch against the shared Ticker, discarding the Ticker if it fails.
+    
+    yfinance marks some data as fetched before the request completes, so a
+    Ticker whose call failed would keep returning empty results. Dropping
+    it makes the next attempt start from a fresh Ticker.
+    
+    Args:
+        symbol: Stock or index ticker symbol
+        fetch: Callable receiving the Ticker and performing the request
+        
+    Returns:
+        Whatever fetch returns
+    """
+    try:
+        return fetch(yf_ticker(symbol))
+    except Exception:
+        _TICKER_CACHE.pop(symbol, None)
+        raise
+
+
+def _fetch_info(ticker: "yf.Ticker") -> Dict[str, Any]:
+    """Return ticker.info, raising if Yahoo Finance returned nothing."""
+    info = ticker.info
+    if not info:
+        raise ValueError(f"Yahoo Finance returned no info for {ticker.ticker}")
+    return info
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_info(symbol: str, time_bucket: int, endpoint: str = "info") -> Dict[str, Any]:
+    """
+    Fetch the Yahoo Finance info dictionary, memoized per time bucket.
+    
+    Misses in memory fall through to the on-disk cache before hitting the
+    network. The endpoint selects the on-disk TTL: "info" for slow-moving
+    fundamentals, "quote" when only the live price fields are used.
+    
+    Args:
+        symbol: Stock or index ticker symbol
+        time_bucket: Value from _time_bucket(), part of the cache key only
+        endpoint: On-disk cache endpoint name ("info" or "quote")
+        
+    Returns:
+        Info dictionary as returned by yf.Ticker.info
+        
+    Raises:
+        Any Yahoo Finance error, including an empty info response; failures
+        are never memoized or written to disk
+    """
+    info = file_cache.get(symbol, endpoint)
+    if info is None:
+        info = with_retries(lambda: _ticker_call(symbol, _fetch_info), f"{symbol} {endpoint}")
+        file_cache.set(symbol, endpoint, info)
+    return info
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_yahoo_price(symbol: str, time_bucket: int) -> Optional[float]:
+    """
+    Fetch the latest price from Yahoo Finance, memoized per time bucket.
+    
+    Exceptions propagate to the caller and are never cached, so a transient
+    API failure is retried on the next call.
+    
+    Args:
+        symbol: Stock ticker symbol
+        time_bucket: Value from _time_bucket(), part of the cache key only
+        
+    Returns:
+        Latest price as float, or None if Yahoo Finance has no price
+    """
+    price = file_cache.get(symbol, "price")
+    if price is not None:
+        return price
+    
+    # Attempt to get today's data. raise_errors=True makes network errors and
+    # timeouts propagate instead of coming back as an empty DataFrame.
+    try:
+        data = with_retries(
+            lambda: _ticker_call(
+                symbol,
+                lambda ticker: ticker.history(period="1d", timeout=YAHOO_TIMEOUT, raise_errors=True)
+            ),
+            f"{symbol} history"
+        )
+    except _yf().exceptions.YFTickerMissingError:
+        # No rows for the period (market holiday, halted or delisted symbol)
+        data = None
+    
+    if data is not None and not data.empty:
+        price = float(data['Close'].iloc[-1])
+        logger.info(f"Retrieved {symbol} from Yahoo Finance: ${price:.2f}")
+    else:
+        # Fallback to fast_info if daily data unavailable; it hits a far lighter
+        # endpoint than the full info dictionary
+        price = with_retries(
+            lambda: _ticker_call(symbol, lambda ticker: ticker.fast_info.get("last_price")),
+            f"{symbol} fast_info"
+        )
+        
+        if price is not None:
+            price = float(price)
+            logger.info(f"Retrieved {symbol} from Yahoo Finance (fast_info): ${price:.2f}")
+    
+    if price is not None:
+        file_cache.set(symbol, "price", price)
+    return price
+
+
+def cache_invalidate(symbol: str) -> None:
+    """
+    Drop every cached entry for a symbol so the next lookup refetches it.
+    
+    Clears the on-disk entries for the symbol and the in-memory caches.
+    The in-memory lookup caches cannot be cleared per key, so they are
+    reset entirely.
+    
+    Args:
+        symbol: Stock or index ticker symbol
+    """
+    symbol = symbol.strip().upper()
+    file_cache.invalidate(symbol)
+    _TICKER_CACHE.pop(symbol, None)
+    _cached_info.cache_clear()
+    _cached_yahoo_price.cache_clear()
+    logger.info(f"Cache invalidated for {symbol}")
+
+
 # ============================================================================
 # Data Retrieval Functions
 # ============================================================================
 
+_CSV_CACHE: Dict[str, Any] = {"mtime": 0, "map": {}}
+
+
 def get_price_from_csv(symbol: str) -> Optional[float]:
     """
     Retrieve stock price from local CSV file (fallback mechanism).
@@ -76,6 +448,10 @@ def get_price_from_csv(symbol: str) -> Optional[float]:
         AAPL,175.64
         MSFT,330.21
     
+    The file is parsed once into a symbol → price dictionary and only
+    reloaded when its modification time changes, so a lookup costs one
+    stat call and one hash lookup.
+    
     Args:
         symbol: Stock ticker symbol (e.g., 'AAPL', 'MSFT')
         
@@ -86,18 +462,36 @@ def get_price_from_csv(symbol: str) -> Optional[float]:
         None (logs errors instead)
     """
     try:
-        if not os.path.exists(CSV_FILE_PATH):
+        try:
+            stat = os.stat(CSV_FILE_PATH)
+        except FileNotFoundError:
             logger.warning(f"CSV file not found: {CSV_FILE_PATH}")
             return None
-            
-        df = pd.read_csv(CSV_FILE_PATH)
-        df['symbol'] = df['symbol'].str.upper()
-        symbol = symbol.upper()
         
-        stock_row = df[df['symbol'] == symbol]
+        if stat.st_mtime != _CSV_CACHE["mtime"]:
+            prices: Dict[str, float] = {}
+            # utf-8-sig strips the BOM Excel writes on "CSV UTF-8" exports
+            with open(CSV_FILE_PATH, newline='', encoding='utf-8-sig') as f:
+                reader = csv.DictReader(f)
+                for row in reader:
+                    # Skip malformed rows individually so one bad line can't
+                    # disable the whole fallback
+                    try:
+                        row_symbol = row['symbol'].strip().upper()
+                        if not row_symbol:
+                            raise ValueError("empty symbol")
+                        prices[row_symbol] = float(row['price'])
+                    except (KeyError, AttributeError, TypeError, ValueError) as e:
+                        logger.warning(f"Skipping malformed CSV row {reader.line_num} "
+                                       f"in {CSV_FILE_PATH}: {e}")
+            _CSV_CACHE["map"] = prices
+            _CSV_CACHE["mtime"] = stat.st_mtime
+            logger.info(f"Loaded {len(_CSV_CACHE['map'])} prices from {CSV_FILE_PATH}")
+        
+        symbol = symbol.upper()
+        price = _CSV_CACHE["map"].get(symbol)
         
-        if not stock_row.empty:
-            price = float(stock_row['price'].iloc[0])
+        if price is not None:
             logger.info(f"Retrieved {symbol} from CSV fallback: ${price:.2f}")
             return price
         else:
@@ -109,13 +503,36 @@ def get_price_from_csv(symbol: str) -> Optional[float]:
         return None
 
 
-def get_stock_price_with_fallback(symbol: str) -> tuple[Optional[float], str]:
+def _fetch_yahoo_price(symbol: str) -> Optional[float]:
+    """
+    Fetch the latest Yahoo Finance price, returning None instead of raising.
+    
+    Args:
+        symbol: Stock ticker symbol
+        
+    Returns:
+        Price as float, or None if Yahoo Finance failed or had no price
+    """
+    try:
+        return _cached_yahoo_price(symbol, _time_bucket())
+    except Exception as e:
+        if isinstance(e, _curl_requests().exceptions.Timeout):
+            logger.warning(f"Yahoo Finance timed out after {YAHOO_TIMEOUT}s for {symbol}")
+            return None
+        logger.debug(f"Yahoo Finance error for {symbol}: {type(e).__name__}")
+        return None
+
+
+async def get_stock_price_with_fallback(symbol: str) -> tuple[Optional[float], str]:
     """
     Retrieve stock price with intelligent fallback mechanism.
     
-    Attempts to fetch price from Yahoo Finance first, then falls back to
-    local CSV file if API is unavailable. This ensures reliability even
-    when external APIs are down.
+    Queries Yahoo Finance and the local CSV file concurrently (a hedged
+    request). The Yahoo Finance price is preferred whenever it arrives
+    within YAHOO_HEDGE_TIMEOUT seconds; otherwise the CSV price is used
+    immediately, so a slow API never stalls the lookup. If the symbol is
+    not in the CSV either, the Yahoo Finance request is awaited for up to
+    YAHOO_TIMEOUT more seconds.
     
     Data Priority:
     1. Yahoo Finance API (real-time data)
@@ -129,47 +546,125 @@ def get_stock_price_with_fallback(symbol: str) -> tuple[Optional[float], str]:
         Returns (None, 'none') if price cannot be retrieved from any source
         
     Example:
-        >>> price, source = get_stock_price_with_fallback("AAPL")
+        >>> price, source = await get_stock_price_with_fallback("AAPL")
         >>> print(f"${price} from {source}")
         $175.64 from yfinance
     """
-    try:
-        ticker = yf.Ticker(symbol)
-        
-        # Attempt to get today's data
-        data = ticker.history(period="1d")
-        
-        if not data.empty:
-            price = float(data['Close'].iloc[-1])
-            logger.info(f"Retrieved {symbol} from Yahoo Finance: ${price:.2f}")
-            return price, 'yfinance'
-        
-        # Fallback to ticker info if daily data unavailable
-        info = ticker.info
-        price = info.get("regularMarketPrice")
-        
-        if price is not None:
-            logger.info(f"Retrieved {symbol} from Yahoo Finance (info): ${price:.2f}")
-            return price, 'yfinance'
+    yf_task = asyncio.create_task(asyncio.to_thread(_fetch_yahoo_price, symbol))
+    csv_task = asyncio.create_task(asyncio.to_thread(get_price_from_csv, symbol))
     
-    except Exception as e:
-        logger.debug(f"Yahoo Finance error for {symbol}: {type(e).__name__}")
+    done, _ = await asyncio.wait([yf_task], timeout=YAHOO_HEDGE_TIMEOUT)
+    if yf_task in done and yf_task.result() is not None:
+        csv_task.cancel()
+        return yf_task.result(), 'yfinance'
     
-    # Use CSV as final fallback
-    csv_price = get_price_from_csv(symbol)
+    # Use CSV as fallback
+    csv_price = await csv_task
     if csv_price is not None:
+        if not yf_task.done():
+            logger.warning(f"Yahoo Finance exceeded {YAHOO_HEDGE_TIMEOUT}s for {symbol}, using CSV fallback")
+            yf_task.cancel()
         return csv_price, 'csv'
     
+    # Nothing in the CSV, so a late Yahoo Finance answer is still worth waiting
+    # for, up to the per-request budget
+    try:
+        price = await asyncio.wait_for(yf_task, timeout=YAHOO_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning(f"Yahoo Finance timed out after {YAHOO_TIMEOUT}s for {symbol}")
+        price = None
+    if price is not None:
+        return price, 'yfinance'
+    
     logger.error(f"Could not retrieve price for {symbol} from any source")
     return None, 'none'
 
 
+# yf.download keeps its results in module-level state, so overlapping batch
+# downloads would overwrite each other's data. The lock serializes batches;
+# other yfinance calls (e.g. a failing history()) can still write to that
+# state, so get_prices_batch only trusts columns for symbols it requested.
+_DOWNLOAD_LOCK = threading.Lock()
+
+
+def get_prices_batch(symbols: list[str]) -> Dict[str, float]:
+    """
+    Retrieve latest Yahoo Finance prices for many symbols in one request.
+    
+    Symbols with a fresh on-disk cache entry are served from the cache; the
+    rest are fetched together with a single yf.download call instead of one
+    Ticker round-trip per symbol. Batch downloads are serialized with
+    _DOWNLOAD_LOCK. No CSV fallback or time bound is applied here, so async
+    callers should wrap this in asyncio.wait_for and route symbols missing
+    from the result through get_stock_price_with_fallback.
+    
+    Args:
+        symbols: Stock ticker symbols (case-insensitive, duplicates ignored)
+        
+    Returns:
+        Dictionary mapping upper-case symbol to price for every symbol
+        Yahoo Finance returned a price for
+        
+    Example:
+        >>> get_prices_batch(["AAPL", "MSFT"])
+        {'AAPL': 175.64, 'MSFT': 330.21}
+    """
+    symbols = list(dict.fromkeys(symbol.strip().upper() for symbol in symbols))
+    prices: Dict[str, float] = {}
+    
+    for symbol in symbols:
+        cached_price = file_cache.get(symbol, "price")
+        if cached_price is not None:
+            prices[symbol] = cached_price
+    
+    missing = [symbol for symbol in symbols if symbol not in prices]
+    if not missing:
+        return prices
+    
+    try:
+        # Not wrapped in with_retries: yf.download catches per-symbol errors
+        # itself, so failed symbols just come back missing and go through the
+        # per-symbol fallback chain, which does retry
+        with _DOWNLOAD_LOCK:
+            data = _yf().download(
+                " ".join(missing),
+                period="1d",
+                group_by="ticker",
+                threads=True,
+                progress=False,
+                timeout=YAHOO_TIMEOUT,
+                session=_http_session()
+            )
+    except Exception as e:
+        logger.debug(f"Yahoo Finance batch error for {missing}: {type(e).__name__}")
+        return prices
+    
+    for symbol in missing:
+        if data.columns.nlevels > 1:
+            if symbol not in data.columns.get_level_values(0):
+                continue
+            closes = data[symbol]["Close"]
+        elif len(missing) == 1 and "Close" in data.columns:
+            closes = data["Close"]
+        else:
+            continue
+        
+        closes = closes.dropna()
+        if not closes.empty:
+            price = float(closes.iloc[-1])
+            prices[symbol] = price
+            file_cache.set(symbol, "price", price)
+            logger.info(f"Retrieved {symbol} from Yahoo Finance (batch): ${price:.2f}")
+    
+    return prices
+
+
 # ============================================================================
 # MCP Tools
 # ============================================================================
 
 @mcp.tool()
-def get_stock_price(symbol: str) -> str:
+async def get_stock_price(symbol: str) -> str:
     """
     Retrieve the current stock price for a given ticker symbol.
     
@@ -201,7 +696,7 @@ def get_stock_price(symbol: str) -> str:
     symbol = symbol.strip().upper()
     logger.info(f"get_stock_price called for {symbol}")
     
-    price, source = get_stock_price_with_fallback(symbol)
+    price, source = await get_stock_price_with_fallback(symbol)
     
     if price is not None:
         source_text = "from Yahoo Finance" if source == 'yfinance' else "from local data"
@@ -213,7 +708,7 @@ def get_stock_price(symbol: str) -> str:
 
 
 @mcp.tool()
-def compare_stocks(symbol1: str, symbol2: str) -> str:
+async def compare_stocks(symbol1: str, symbol2: str) -> str:
     """
     Compare the current prices of two stock symbols.
     
@@ -243,8 +738,28 @@ def compare_stocks(symbol1: str, symbol2: str) -> str:
     
     logger.info(f"compare_stocks called: {symbol1} vs {symbol2}")
     
-    price1, _ = get_stock_price_with_fallback(symbol1)
-    price2, _ = get_stock_price_with_fallback(symbol2)
+    # Fetch both prices in a single Yahoo Finance round-trip, bounded like the
+    # hedged single-symbol lookup so a slow batch can't stall the comparison
+    try:
+        prices = await asyncio.wait_for(
+            asyncio.to_thread(get_prices_batch, [symbol1, symbol2]),
+            timeout=YAHOO_HEDGE_TIMEOUT
+        )
+    except asyncio.TimeoutError:
+        logger.warning(f"Yahoo Finance batch exceeded {YAHOO_HEDGE_TIMEOUT}s for "
+                       f"{symbol1}, {symbol2}; using per-symbol fallback")
+        prices = {}
+    
+    # Symbols missing from the batch go through the per-symbol fallback chain
+    missing = [symbol for symbol in (symbol1, symbol2) if symbol not in prices]
+    fallbacks = await asyncio.gather(
+        *(get_stock_price_with_fallback(symbol) for symbol in missing)
+    )
+    for symbol, (price, _) in zip(missing, fallbacks):
+        prices[symbol] = price
+    
+    price1 = prices[symbol1]
+    price2 = prices[symbol2]
     
     if price1 is None:
         return f"ERROR: Could not retrieve price for {symbol1}"
@@ -266,7 +781,7 @@ def compare_stocks(symbol1: str, symbol2: str) -> str:
 
 
 @mcp.tool()
-def get_stock_fundamentals(symbol: str) -> str:
+async def get_stock_fundamentals(symbol: str) -> str:
     """
     Retrieve key financial fundamentals and metrics for a stock.
     
@@ -300,8 +815,27 @@ def get_stock_fundamentals(symbol: str) -> str:
     logger.info(f"get_stock_fundamentals called for {symbol}")
     
     try:
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
+        # Blocking network I/O runs in worker threads so it never stalls the event loop.
+        # info can be up to a day old on disk, so the current price comes from the
+        # price lookup, whose cache entries expire after minutes. The two run
+        # concurrently but are bounded separately, so a slow price lookup only
+        # costs the fresher price, never the whole tool call.
+        price_task = asyncio.create_task(asyncio.to_thread(_fetch_yahoo_price, symbol))
+        try:
+            info = await asyncio.wait_for(
+                asyncio.to_thread(_cached_info, symbol, _time_bucket()),
+                timeout=YAHOO_TIMEOUT
+            )
+        except BaseException:
+            price_task.cancel()
+            raise
+        
+        try:
+            price = await asyncio.wait_for(price_task, timeout=YAHOO_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning(f"Yahoo Finance timed out after {YAHOO_TIMEOUT}s for {symbol} price")
+            price = None
+        current_price = price if price is not None else info.get("regularMarketPrice")
         
         # Extract key fundamentals
         name = info.get("longName", "N/A")
@@ -310,36 +844,38 @@ def get_stock_fundamentals(symbol: str) -> str:
         dividend_yield = info.get("dividendYield")
         week_52_high = info.get("fiftyTwoWeekHigh")
         week_52_low = info.get("fiftyTwoWeekLow")
-        current_price = info.get("regularMarketPrice")
         
         # Format output
-        result = f"**{name} ({symbol}) - Financial Fundamentals**\n\n"
+        parts = [f"**{name} ({symbol}) - Financial Fundamentals**\n\n"]
         
         if current_price:
-            result += f"Current Price: ${current_price:.2f}\n"
+            parts.append(f"Current Price: ${current_price:.2f}\n")
         if market_cap:
             market_cap_formatted = f"${market_cap/1e12:.2f}T" if market_cap >= 1e12 else f"${market_cap/1e9:.2f}B"
-            result += f"Market Capitalization: {market_cap_formatted}\n"
+            parts.append(f"Market Capitalization: {market_cap_formatted}\n")
         if pe_ratio and pe_ratio > 0 and pe_ratio < 500:
-            result += f"P/E Ratio: {pe_ratio:.2f}\n"
+            parts.append(f"P/E Ratio: {pe_ratio:.2f}\n")
         if dividend_yield is not None and dividend_yield > 0 and dividend_yield < 0.20:
             # dividend_yield is in decimal form (0.0042 = 0.42%), multiply by 100 for percentage
-            result += f"Dividend Yield: {dividend_yield*100:.2f}%\n"
+            parts.append(f"Dividend Yield: {dividend_yield*100:.2f}%\n")
         if week_52_low and week_52_high:
-            result += f"52-Week Range: ${week_52_low:.2f} - ${week_52_high:.2f}\n"
+            parts.append(f"52-Week Range: ${week_52_low:.2f} - ${week_52_high:.2f}\n")
         
-        if result == f"**{name} ({symbol}) - Financial Fundamentals**\n\n":
+        if len(parts) == 1:
             return f"Limited fundamental data available for {symbol}. Some metrics may not be available."
         
-        return result
+        return "".join(parts)
         
+    except asyncio.TimeoutError:
+        logger.error(f"Yahoo Finance timed out after {YAHOO_TIMEOUT}s for {symbol} fundamentals")
+        return f"ERROR: Could not retrieve fundamentals for {symbol}. Yahoo Finance timed out."
     except Exception as e:
         logger.error(f"Error retrieving fundamentals for {symbol}: {e}")
         return f"ERROR: Could not retrieve fundamentals for {symbol}. {str(e)}"
 
 
 @mcp.tool()
-def get_market_summary() -> str:
+async def get_market_summary() -> str:
     """
     Retrieve summary data for major market indices.
     
@@ -362,6 +898,7 @@ def get_market_summary() -> str:
         - Indices update during market hours
         - May be delayed 15-20 minutes
         - Percentages show daily change
+        - Indices are fetched concurrently
     
     Raises:
         None (returns error message instead)
@@ -375,31 +912,44 @@ def get_market_summary() -> str:
     }
     
     try:
-        result = "**Market Summary**\n\n"
+        parts = ["**Market Summary**\n\n"]
+        
+        # Fetch all indices concurrently; wall time is the slowest single request
+        time_bucket = _time_bucket()
+        infos = await asyncio.gather(
+            *(asyncio.wait_for(
+                asyncio.to_thread(_cached_info, symbol, time_bucket, "quote"),
+                timeout=YAHOO_TIMEOUT
+              ) for symbol in indices.values()),
+            return_exceptions=True
+        )
         
-        for name, symbol in indices.items():
+        for (name, symbol), info in zip(indices.items(), infos):
             try:
-                ticker = yf.Ticker(symbol)
-                info = ticker.info
+                if isinstance(info, Exception):
+                    raise info
                 
                 price = info.get("regularMarketPrice")
                 change = info.get("regularMarketChange")
                 change_pct = info.get("regularMarketChangePercent")
                 
                 if price:
-                    change_str = f"+{change:.2f}" if change and change >= 0 else f"{change:.2f}" if change else "N/A"
-                    pct_str = f"+{change_pct:.2f}%" if change_pct and change_pct >= 0 else f"{change_pct:.2f}%" if change_pct else "N/A"
+                    change_str = f"{change:+.2f}" if change is not None else "N/A"
+                    pct_str = f"{change_pct:+.2f}%" if change_pct is not None else "N/A"
                     
-                    result += f"{name} ({symbol}): ${price:,.2f} ({change_str}, {pct_str})\n"
+                    parts.append(f"{name} ({symbol}): ${price:,.2f} ({change_str}, {pct_str})\n")
                 else:
-                    result += f"{name} ({symbol}): Data unavailable\n"
+                    parts.append(f"{name} ({symbol}): Data unavailable\n")
                     
+            except asyncio.TimeoutError:
+                logger.warning(f"Yahoo Finance timed out after {YAHOO_TIMEOUT}s for {name}")
+                parts.append(f"{name} ({symbol}): Error retrieving data\n")
             except Exception as e:
                 logger.warning(f"Could not retrieve data for {name}: {e}")
-                result += f"{name} ({symbol}): Error retrieving data\n"
+                parts.append(f"{name} ({symbol}): Error retrieving data\n")
         
-        result += "\n*Data sourced from Yahoo Finance (may be delayed 15-20 minutes)*"
-        return result
+        parts.append("\n*Data sourced from Yahoo Finance (may be delayed 15-20 minutes)*")
+        return "".join(parts)
         
     except Exception as e:
         logger.error(f"Error retrieving market summary: {e}")
@@ -430,6 +980,13 @@ if __name__ == "__main__":
     
     Environment Variables:
         STOCK_CSV_PATH: Path to CSV fallback file (optional)
+        STOCK_YAHOO_TIMEOUT: Per-request Yahoo Finance timeout in seconds (default 5)
+        STOCK_YAHOO_ATTEMPTS: Attempts per Yahoo Finance call on transient errors (default 3)
+        STOCK_HEDGE_TIMEOUT: Seconds to wait for Yahoo Finance before using CSV (default 2)
+        STOCK_CACHE_TTL: In-memory cache lifetime in seconds (default 60)
+        STOCK_CACHE_DIR: On-disk cache directory (default ./.cache)
+        STOCK_PRICE_CACHE_TTL: On-disk price cache lifetime (default 900)
+        STOCK_INFO_CACHE_TTL: On-disk fundamentals cache lifetime (default 86400)
     
     Server Details:
         - Server Name: "Stock Server"
@@ -0,0 +1,37 @@
+"""Unit tests for the client's regex fast path (no MCP server or Groq API needed)."""
+import pytest
+
+from mcp_client import match_fast_path
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("What is the price of AAPL?", ("get_stock_price", {"symbol": "AAPL"})),
+    ("price of MSFT", ("get_stock_price", {"symbol": "MSFT"})),
+    ("quote for $NVDA", ("get_stock_price", {"symbol": "NVDA"})),
+    ("AAPL stock price", ("get_stock_price", {"symbol": "AAPL"})),
+    ("Compare AAPL and MSFT", ("compare_stocks", {"symbol1": "AAPL", "symbol2": "MSFT"})),
+    ("compare the price of AAPL and MSFT", ("compare_stocks", {"symbol1": "AAPL", "symbol2": "MSFT"})),
+    ("AAPL vs MSFT", ("compare_stocks", {"symbol1": "AAPL", "symbol2": "MSFT"})),
+    ("fundamentals for BRK.B", ("get_stock_fundamentals", {"symbol": "BRK.B"})),
+    ("What is the P/E ratio of TSLA", ("get_stock_fundamentals", {"symbol": "TSLA"})),
+    ("Give me a market summary", ("get_market_summary", {})),
+    ("market summary", ("get_market_summary", {})),
+    ("How are the markets doing today?", ("get_market_summary", {})),
+])
+def test_canonical_queries_are_routed(query, expected):
+    tool_name, arguments = expected
+    assert match_fast_path(query) == {"tool_name": tool_name, "arguments": arguments}
+
+
+@pytest.mark.parametrize("query", [
+    "price of AAPL vs MSFT",
+    "Is the price of AAPL higher than MSFT?",
+    "show fundamentals for MSFT and GOOGL",
+    "quote for AT&T",
+    "price of apple",
+    "compare aapl and msft",
+    "Compare Apple and Microsoft",
+    "What was the price of AAPL last year?",
+])
+def test_ambiguous_queries_fall_through_to_llm(query):
+    assert match_fast_path(query) is None
@@ -0,0 +1,55 @@
+"""Unit tests for the server's CSV fallback loader (no network or MCP client needed)."""
+import pytest
+
+import mcp_server
+
+
+@pytest.fixture
+def csv_file(tmp_path, monkeypatch):
+    """Point the server at a temporary CSV file with an empty load cache."""
+    path = tmp_path / "stocks_data.csv"
+    monkeypatch.setattr(mcp_server, "CSV_FILE_PATH", str(path))
+    monkeypatch.setattr(mcp_server, "_CSV_CACHE", {"mtime": 0, "map": {}})
+    return path
+
+
+def test_reads_prices_case_insensitively(csv_file):
+    csv_file.write_text("symbol,price\naapl,175.64\nMSFT,330.21\n", encoding="utf-8")
+    assert mcp_server.get_price_from_csv("AAPL") == 175.64
+    assert mcp_server.get_price_from_csv("msft") == 330.21
+    assert mcp_server.get_price_from_csv("GOOGL") is None
+
+
+def test_reads_file_with_utf8_bom(csv_file):
+    csv_file.write_bytes("symbol,price\nAAPL,175.64\nMSFT,330.21\n".encode("utf-8-sig"))
+    assert mcp_server.get_price_from_csv("AAPL") == 175.64
+    assert mcp_server.get_price_from_csv("MSFT") == 330.21
+
+
+def test_skips_malformed_rows_only(csv_file):
+    csv_file.write_text(
+        "symbol,price\n"
+        "AAPL,175.64\n"
+        "MSFT,\n"       # blank price
+        ",135.45\n"     # blank symbol
+        "GOOGL\n"       # missing price field
+        "AMZN,abc\n"    # unparseable price
+        "TSLA,248.50\n",
+        encoding="utf-8"
+    )
+    assert mcp_server.get_price_from_csv("AAPL") == 175.64
+    assert mcp_server.get_price_from_csv("TSLA") == 248.50
+    for symbol in ("MSFT", "GOOGL", "AMZN"):
+        assert mcp_server.get_price_from_csv(symbol) is None
+
+
+def test_missing_file_returns_none(csv_file):
+    assert mcp_server.get_price_from_csv("AAPL") is None
+
+
+def test_reloads_when_file_changes(csv_file):
+    csv_file.write_text("symbol,price\nAAPL,175.64\n", encoding="utf-8")
+    assert mcp_server.get_price_from_csv("AAPL") == 175.64
+    csv_file.write_text("symbol,price\nAAPL,180.00\n", encoding="utf-8")
+    mcp_server._CSV_CACHE["mtime"] = -1  # force a stale mtime regardless of timestamp resolution
+    assert mcp_server.get_price_from_csv("AAPL") == 180.00